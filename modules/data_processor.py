@@ -4,11 +4,16 @@ Data processor for handling data logging, storage, and export.
 """
 import tkinter as tk
 from tkinter import ttk
-import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
+# A matplotlib (és az xlsxwriter) csak exportkor kell - lusta importjuk
+# az export függvényekben, sokat farag az indulási időből/memóriából
+import collections
+import csv
 import json
+import math
+import operator
 import os
-import threading
+import time
 import atexit
 from datetime import datetime
 from typing import List, TYPE_CHECKING, Dict, Any, Optional
@@ -16,24 +21,157 @@ from typing import List, TYPE_CHECKING, Dict, Any, Optional
 if TYPE_CHECKING:
     from .temp_logger_core import TempLoggerApp  # Adjust if needed
 
-from .helpers import get_next_counter, generate_short_uuid, sanitize_filename, format_duration, evaluate_operator
+from .helpers import get_next_counter, generate_short_uuid, sanitize_filename, format_duration
+
+# Bound encoder: ensure_ascii=True stays on (the fastest path through
+# CPython's C encoder; non-ASCII sensor names are escaped in the raw log
+# but round-trip identically through json.loads), and compact separators
+# skip the per-pair whitespace bytes. Binding .encode once also avoids
+# json.dumps re-building an encoder from kwargs on every sample.
+_json_dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+_CSV_CHUNK_ROWS = 1000  # rows per writerows() batch during CSV export
+_NAN = float("nan")  # hiányzó leolvasás jelölője a pufferben
+
+# Operátor-szimbólum -> C szintű összehasonlító. A feltétel-fordítás ezt
+# oldja fel egyszer, így a tick-enkénti kiértékelés nem hasonlítgat
+# operátor-stringeket (lásd helpers.evaluate_operator).
+_OP_FUNCS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '=': operator.eq,
+}
+
+# Formatted-timestamp memo: resolution is one second, so every caller
+# within the same second shares one strftime result.
+_ts_cache = [0, ""]
+
+def _fmt_ts(sec: int) -> str:
+    """Format a Unix second as 'YYYY-mm-dd HH:MM:SS', memoized per second."""
+    if _ts_cache[0] != sec:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    return _ts_cache[1]
+_INITIAL_CAPACITY = 1024  # rows allocated up front for the sample buffers
+_PLOT_MAX_POINTS = 2000  # per-series point budget for the export plots
+
+def _downsample_minmax(xs: np.ndarray, ys: np.ndarray, n_out: int = _PLOT_MAX_POINTS):
+    """Reduce a series to ~n_out points, keeping each bucket's min and max.
+
+    A 1000-pixel-wide figure cannot show more detail than the per-bucket
+    extremes, so the rendered plot is visually identical while matplotlib
+    processes orders of magnitude fewer vertices on long sessions.
+    """
+    n = len(xs)
+    if n <= n_out:
+        return xs, ys
+
+    n_buckets = max(1, n_out // 2)
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.intp)
+    keep = []
+    for b in range(n_buckets):
+        lo, hi = edges[b], edges[b + 1]
+        if hi <= lo:
+            continue
+        seg = ys[lo:hi]
+        if np.all(np.isnan(seg)):
+            keep.append(lo)  # keep the gap visible
+            continue
+        i_min = lo + int(np.nanargmin(seg))
+        i_max = lo + int(np.nanargmax(seg))
+        keep.append(min(i_min, i_max))
+        if i_max != i_min:
+            keep.append(max(i_min, i_max))
+
+    idx = np.asarray(keep, dtype=np.intp)
+    return xs[idx], ys[idx]
 
 class DataProcessor:
-    """Handles data logging, limiting, and exporting."""
-    
+    """Handles data logging, limiting, and exporting.
+
+    Samples are stored column-wise (structure-of-arrays): the numeric
+    columns live in typed NumPy buffers instead of per-row Python lists,
+    which avoids boxing every float and lets export/plot slice columns
+    directly.
+
+    Layout invariants: _types and _timestamps are plain lists of length
+    _n; _seconds (int64) and _temps (float32, one column per sensor) are
+    over-allocated arrays of which only the first _n rows are valid.
+    Missing readings are NaN in _temps and map back to None on export.
+    All four are appended/trimmed together by the single sampling worker;
+    readers only run once that worker has been joined (see
+    log_data_point), so the buffers need no lock.
+    """
+
     def __init__(self, app: 'TempLoggerApp'):
         self.app = app
-        self.data: List[List] = []
-        self.lock = threading.Lock()
+        self._types: List[str] = []
+        self._timestamps: List[str] = []
+        self._seconds = np.empty(0, dtype=np.int64)
+        self._temps = np.empty((0, 0), dtype=np.float32)
+        self._n = 0
+        # A mintavevő szál ide teszi az új sorokat; a Tk oldal üríti.
+        # A deque append/popleft a CPython-ban külön zár nélkül is biztonságos.
+        self._sample_q: collections.deque = collections.deque(maxlen=10000)
+        self._log_interval_s = 10
+        self._duration_limit_s: Optional[int] = None
+        # A szenzor-oszlopnevek immutábilis tuple-je: a JSON kulcsokhoz és
+        # az exporthoz is ez jár, nem a data_columns[3:] szelet-allokáció
+        self._sensor_cols: tuple = ()
+        # (feltétel-lista azonosság, lefordított alak) - lásd _compile_conditions
+        self._cond_cache: tuple = (None, [])
         self.current_session_folder = None
         self.session_counter = None
         self.session_uuid = None
         self.session_start_time = None
         self.session_end_time = None
         self.temp_session_folder = None
+        self._final_session_folder = None
+        self._export_base_path = None
         # Register cleanup to handle app closure
         atexit.register(self.finalize_session_folder)
 
+    def _allocate_buffers(self, n_sensors: int, capacity: int = _INITIAL_CAPACITY):
+        """Reset the columnar sample buffers for n_sensors channels."""
+        self._types = []
+        self._timestamps = []
+        self._seconds = np.empty(capacity, dtype=np.int64)
+        self._temps = np.full((capacity, n_sensors), np.nan, dtype=np.float32)
+        self._n = 0
+
+    def _grow_buffers(self):
+        """Double the numeric buffers when the capacity is exhausted.
+
+        Geometric growth keeps the total realloc/copy work O(n) over a
+        session instead of one copy per _INITIAL_CAPACITY rows.
+        """
+        extra = max(len(self._seconds), _INITIAL_CAPACITY)
+        self._seconds = np.concatenate(
+            [self._seconds, np.empty(extra, dtype=np.int64)])
+        self._temps = np.concatenate(
+            [self._temps, np.full((extra, self._temps.shape[1]), np.nan, dtype=np.float32)])
+
+    @property
+    def row_count(self) -> int:
+        """Number of samples currently buffered."""
+        return self._n
+
+    def _iter_rows(self, start: int = 0, stop: Optional[int] = None):
+        """Yield buffered samples as row lists (NaN mapped back to None).
+
+        A float32 tárolási zaj (25.062 -> 25.062000274658203) itt tűnik
+        el: a CSV-exporttal azonos '%.8g' kerekítés adja vissza a szenzor
+        tényleges leolvasását.
+        """
+        if stop is None:
+            stop = self._n
+        isnan = math.isnan
+        for i in range(start, stop):
+            temps = [None if isnan(v) else float('%.8g' % v) for v in self._temps[i]]
+            yield [self._types[i], int(self._seconds[i]), self._timestamps[i]] + temps
+
     def get_total_duration_seconds(self) -> Optional[int]:
         """Calculate the total logging duration in seconds."""
         try:
@@ -53,71 +191,267 @@ class DataProcessor:
         # Létrehozzuk a mappa nevét az AT sorszámmal (AT:xxxx) és a mérés névvel
         sanitized_name = sanitize_filename(measurement_name)
         folder_name = f"AT:{self.session_counter:04d}_{sanitized_name}_{self.session_uuid}"
-        
-        self.current_session_folder = os.path.join(self.app.measurement_folder, folder_name)
-        
-        # Mappa létrehozása
-        if not os.path.exists(self.current_session_folder):
-            os.makedirs(self.current_session_folder, exist_ok=True)
 
-        self.data = []
+        # A futó mérés ".part" jelölésű mappába ír; a végleges névre egy
+        # atomikus os.replace emeli át lezáráskor (finalize_session_folder).
+        # Így félbeszakadt mérés mindig felismerhető a mappanévről.
+        self._final_session_folder = os.path.join(self.app.measurement_folder, folder_name)
+        self.temp_session_folder = self._final_session_folder + ".part"
+        self.current_session_folder = self.temp_session_folder
+
+        # Mappa létrehozása (exist_ok: nem kell külön exists() stat hívás)
+        os.makedirs(self.current_session_folder, exist_ok=True)
+
+        # Az export alap-útvonala a végleges mappanévből, egyszer - az
+        # export_data már csak kiterjesztést fűz hozzá
+        self._export_base_path = os.path.join(self._final_session_folder, folder_name)
+
         self.session_start_time = datetime.now()
         self.session_end_time = None
-        
+
         # Frissítjük az oszlopneveket a Treeview-hoz és az exportáláshoz
         self.app.data_columns = ["Type", "Seconds", "Timestamp"] + [self.app.sensor_manager.sensor_names[sid] for sid in self.app.sensor_manager.sensor_ids]
+        # Név -> oszlopindex egyszer, hogy az export ne keressen lineárisan
+        self._col_index = {c: i for i, c in enumerate(self.app.data_columns)}
+        # A szenzor-oszlopok a session alatt állandók - egyszer épül
+        self._sensor_cols = tuple(self.app.data_columns[3:])
+        self._allocate_buffers(len(self.app.sensor_manager.sensor_ids))
 
         # Export állapotok visszaállítása (hogy újra exportálhassunk)
         self.app.export_manager.reset_exports()
 
+    def initialize_session(self):
+        """Prepare a new logging session: folder, raw log file, buffers."""
+        self._log_interval_s = self.app._log_interval_s
+        # Az időtartam-korlátot induláskor olvassuk ki (még a Tk szálon);
+        # a mintavevő szál így csak egy sima int-tel hasonlít
+        self._duration_limit_s = (self.get_total_duration_seconds()
+                                  if self.app.duration_enabled.get() else None)
+
+        self.init_new_session(self.app.measurement_name.get())
+
+        # Fix időtartamnál a várható mintaszám ismert: egyben lefoglaljuk,
+        # így a mérés alatt egyszer sem kell újraallokálni. A vágási
+        # plafon (max_log_lines*2) fölé nincs értelme foglalni.
+        if self._duration_limit_s:
+            expected = self._duration_limit_s // max(1, self._log_interval_s) + 16
+            expected = min(expected, self.app.max_log_lines * 2 + 1)
+            if expected > len(self._seconds):
+                self._allocate_buffers(self._temps.shape[1], capacity=expected)
+
+        # A fájlnév a végleges mappanévből készül: a .part utótag csak a
+        # könyvtárat jelöli, a benne lévő log már a végső nevén jön létre
+        log_path = os.path.join(
+            self.current_session_folder,
+            os.path.basename(self._final_session_folder) + ".jsonl")
+        # 64 KB-os blokk-pufferelés: a syscall-ok sorok tucatjaira
+        # oszlanak el, a lemez lapméretű írásokat kap. A tartósságot a
+        # 2 másodperces időzített flush (core) és a stop-kori fsync adja -
+        # áramszünetnél legfeljebb ~2 mp minta veszhet el.
+        self.app.log_file = open(log_path, "w", encoding="utf-8", buffering=1 << 16)
+
+        self._sample_q.clear()
+        # Tk szálon futunk: az élő nézet itt ürül, mielőtt az új session
+        # mintái megérkeznének
+        self.app.gui.clear_log_view()
+
+    def log_data_worker(self):
+        """Persistent sampling loop, run on the session's worker thread.
+
+        One thread lives for the whole session (no per-tick Timer
+        objects); samples are appended to the deque and the Tk side
+        drains them via update_live_data().
+        """
+        app = self.app
+        read_sensors = app.sensor_manager.read_sensors
+        sensor_ids = app.sensor_manager.sensor_ids
+        interval = self._log_interval_s
+        # Abszolút ütemterv: a következő határidő mindig az előzőből lép
+        # tovább (deadline += interval), nem az aktuális időből - így a
+        # feldolgozás/alvás pontatlansága nem halmozódik driftté
+        deadline = time.monotonic()
+
+        while app.running_event.is_set():
+            deadline += interval
+            try:
+                temps = read_sensors()
+            except Exception as e:
+                app.log_to_display(f"Sensor read failed: {e}\n")
+                temps = {sid: None for sid in sensor_ids}
+
+            # Egy óraleolvasás mintánként: az elapsed és a timestamp is
+            # ugyanabból a time.time()-ból jön; a time.strftime olcsóbb,
+            # mint egy datetime objektum allokálása + strftime
+            now = time.time()
+            elapsed = int(now - app.measure_start_time)
+            timestamp = _fmt_ts(int(now))
+            entry = ["LOG", elapsed, timestamp] + [temps.get(sid) for sid in sensor_ids]
+
+            self.log_data_point(entry)
+            self._sample_q.append(entry)
+
+            # Leállítási feltételek a frissen olvasott értékeken - nincs
+            # külön feltétel-ellenőrző kör és újabb szenzor-olvasás.
+            # A stop_logging a Tk szálon fut (root.after), a ciklus pedig
+            # a running_event törlésére magától kilép.
+            if self._duration_limit_s is not None and elapsed >= self._duration_limit_s:
+                app.log_to_display("STOP CONDITION: Fixed duration reached.\n")
+                app.root.after(0, app.stop_logging)
+                return
+            if app._temp_stop_enabled_b and self.check_conditions(app.stop_conditions, temps):
+                app.log_to_display("STOP CONDITION: Temperature condition met.\n")
+                app.root.after(0, app.stop_logging)
+                return
+
+            # Ha egy tick túlcsúszott (pl. lassú szenzor), nem próbáljuk
+            # behozni a lemaradást gyors egymás utáni mintákkal
+            now_mono = time.monotonic()
+            if deadline < now_mono:
+                deadline = now_mono
+
+            # Alvás a maradék intervallumra, de leállításkor gyorsan kilép
+            while app.running_event.is_set() and time.monotonic() < deadline:
+                time.sleep(min(0.2, max(0.0, deadline - time.monotonic())))
+
+    def update_live_data(self):
+        """Drain queued samples on the Tk thread and refresh live widgets."""
+        drained = []
+        q = self._sample_q
+        while q:
+            drained.append(q.popleft())
+
+        if drained:
+            # Type nélkül: a Treeview oszlopai Seconds-szal kezdődnek
+            self.app.gui.bulk_append_rows([entry[1:] for entry in drained])
+
+        # A legutolsó leolvasás a hőmérséklet címkékre
+        sensor_manager = self.app.sensor_manager
+        temps = sensor_manager.get_last_readings()
+        for sid, lbl in sensor_manager.temp_labels.items():
+            t = temps.get(sid)
+            lbl.config(text=f"{t:.2f}" if t is not None else "N/A")
+
+    def finalize_session(self):
+        """Stamp the session end time and close the raw log file."""
+        self.session_end_time = datetime.now()
+        if self.app.log_file:
+            try:
+                self.app.log_file.flush()
+                os.fsync(self.app.log_file.fileno())
+                self.app.log_file.close()
+            except OSError:
+                pass
+            finally:
+                self.app.log_file = None
+        self.finalize_session_folder()
+
     def finalize_session_folder(self):
-        """Placeholder for cleanup."""
-        pass
+        """Publish the in-progress session folder under its final name.
+
+        One atomic os.replace instead of an exists()+rename pair - no
+        TOCTOU window, which matters because this also runs from atexit.
+        """
+        temp = self.temp_session_folder
+        if not temp:
+            return
+        try:
+            os.replace(temp, self._final_session_folder)
+            self.current_session_folder = self._final_session_folder
+        except (FileNotFoundError, OSError):
+            pass
+        self.temp_session_folder = None
 
     def reset_session(self):
         """Reset internal data structures after logging and export."""
-        self.data = []
+        self._allocate_buffers(0)
         # Az aktuális munkamappát megtartjuk, ha meg akarják nyitni
         self.session_start_time = None
         self.session_end_time = None
-        self.app.data_columns = ["Type", "Seconds", "Timestamp"] 
+        self.app.data_columns = ["Type", "Seconds", "Timestamp"]
+        self._sensor_cols = ()
         self.app.gui.update_log_treeview_columns([])
 
     def log_data_point(self, log_entry: List[Any]):
-        """Append a new data point to the internal list and optionally to the file."""
-        with self.lock:
-            # Add to internal data list
-            self.data.append(log_entry)
-            
-            # Check max log lines limit for display (not logging, as per user request)
-            if len(self.data) > self.app.max_log_lines * 2: # Keep some buffer
-                self.data = self.data[-self.app.max_log_lines:] 
-
-            # Write to raw JSON log file
-            if self.app.log_file:
-                json_data = {
-                    "Type": log_entry[0],
-                    "Seconds": log_entry[1],
-                    "Timestamp": log_entry[2],
-                    "Data": {self.app.data_columns[i]: log_entry[i] for i in range(3, len(log_entry))}
-                }
-                # log_entry[3:]-ban vannak a szenzor adatok
-                self.app.log_file.write(json.dumps(json_data) + "\n")
-                self.app.log_file.flush()
+        """Append a new data point to the column buffers and optionally to the file.
+
+        Single-writer invariant: only the session's sampling worker calls
+        this, and every reader of the buffers (export_data, reset_session)
+        runs after stop_logging has joined that worker. A per-sample
+        mutex would therefore never be contended - it only adds an
+        acquire/release pair to the hot path, so there is none.
+        """
+        if self._n == len(self._seconds):
+            self._grow_buffers()
+
+        i = self._n
+        self._types.append(log_entry[0])
+        self._timestamps.append(log_entry[2])
+        self._seconds[i] = log_entry[1]
+        # Gyors út: a w1thermsensor float-ot ad, így a type() azonosság-
+        # ellenőrzés szinte mindig talál; az isinstance ág csak a ritka
+        # int/None esetekre marad
+        self._temps[i, :] = [
+            v if type(v) is float else
+            (float(v) if isinstance(v, (int, float)) else _NAN)
+            for v in log_entry[3:]]
+        self._n = i + 1
+
+        # Check max log lines limit for display (not logging, as per user request)
+        max_rows = self.app.max_log_lines
+        if self._n > max_rows * 2: # Keep some buffer
+            drop = self._n - max_rows
+            self._seconds[:max_rows] = self._seconds[drop:self._n]
+            self._temps[:max_rows] = self._temps[drop:self._n]
+            del self._types[:drop]
+            del self._timestamps[:drop]
+            self._n = max_rows
+
+        # Write to raw JSON log file
+        if self.app.log_file:
+            json_data = {
+                "Type": log_entry[0],
+                "Seconds": log_entry[1],
+                "Timestamp": log_entry[2],
+                # log_entry[3:]-ban vannak a szenzor adatok; a kulcs-tuple
+                # egyszer épült a session elején, itt csak zip-elünk
+                "Data": dict(zip(self._sensor_cols, log_entry[3:]))
+            }
+            self.app.log_file.write(_json_dumps(json_data) + "\n")
+
+    def _compile_conditions(self, conditions: List[Dict[str, Any]]):
+        """Resolve condition dicts into (sensors, op, threshold, logic) tuples.
+
+        Cached by list identity: the condition lists are replaced
+        wholesale when the configuration or the GUI rows change, so the
+        per-tick path pays the dict lookups and operator-string dispatch
+        only once per list, not per evaluation.
+        """
+        if conditions is self._cond_cache[0]:
+            return self._cond_cache[1]
+        compiled = [(tuple(cond['sensors']),
+                     _OP_FUNCS.get(cond['operator']),
+                     cond['threshold'],
+                     cond.get('logic') or 'AND')
+                    for cond in conditions]
+        self._cond_cache = (conditions, compiled)
+        return compiled
 
     def check_conditions(self, conditions: List[Dict[str, Any]], current_temps: Dict[str, Optional[float]]) -> bool:
         """Check if any of the given conditions are met."""
         if not conditions:
             return False
 
+        compiled = self._compile_conditions(conditions)
         results = []
-        for cond in conditions:
-            is_met = any(evaluate_operator(current_temps.get(sid), cond['threshold'], cond['operator'])
-                         for sid in cond['sensors'])
-            results.append(is_met)
-
-        if not results:
-            return False
+        for sensors, op, threshold, _logic in compiled:
+            met = False
+            if op is not None:
+                for sid in sensors:
+                    t = current_temps.get(sid)
+                    if t is not None and op(t, threshold):
+                        met = True
+                        break
+            results.append(met)
 
         # Ha csak egy feltétel van
         if len(results) == 1:
@@ -126,91 +460,127 @@ class DataProcessor:
         # Ha több feltétel van, a logikai operátor határozza meg
         final_result = results[0]
         for i in range(len(results) - 1):
-            cond = conditions[i]
             next_result = results[i + 1]
-            logic = cond.get('logic', 'AND') # feltételezünk AND-et, ha nincs megadva
+            logic = compiled[i][3]
 
             if logic == 'OR':
                 final_result = final_result or next_result
             else: # AND
                 final_result = final_result and next_result
-        
+
         return final_result
 
-    def export_data(self):
-        """Export data to CSV, Excel, and generate plots."""
-        if not self.data:
+    def export_data(self, progress_cb=None):
+        """Export data to CSV, Excel, and generate plots.
+
+        Runs on the export worker thread; progress percentages are
+        marshaled back to the Tk thread with root.after, and log messages
+        go through the thread-safe display queue.
+        """
+        def _progress(pct):
+            if progress_cb:
+                self.app.root.after(0, progress_cb, pct)
+
+        if not self._n:
             self.app.log_to_display("Export skipped: No data logged in this session.\n")
             return
 
-        if not self.app.generate_output_var.get():
-            self.app.log_to_display("Export skipped: Output generation disabled.\n")
-            return
-            
+        # A generate_output_var-t a stop_logging olvassa ki a Tk szálon,
+        # és bool-ként adja tovább - itt már nem nyúlunk Tcl változóhoz
+
         self.app.log_to_display(f"Exporting data to: {self.current_session_folder}\n")
-        
-        base_name = os.path.basename(self.current_session_folder)
-        base_path = os.path.join(self.current_session_folder, base_name)
-        
-        # 1. Alap adatkeret létrehozása
-        df = pd.DataFrame(self.data, columns=self.app.data_columns)
-        
-        # Átalakítjuk a szenzor oszlopokat, hogy a "None" értékek helyett NaN legyen a plotoláshoz
-        for col in self.app.data_columns[3:]:
-            # Az oszlop adatait megpróbáljuk float-ra konvertálni, a None/Inactive értékeket kihagyva
-            df[col] = pd.to_numeric(df[col], errors='coerce') 
 
-        # 2. Export Excelbe
+        base_path = self._export_base_path
+        n = self._n
+
+        # 1. Export Excelbe: a sorok közvetlenül az oszlop-pufferekből
+        # streamelnek a worksheetbe, nem kell hozzá DataFrame másolat
         excel_path = f"{base_path}.xlsx"
         self.app.log_to_display(f"-> Generating Excel: {excel_path}\n")
-        self._save_to_excel(df, excel_path)
-        
-        # 3. Export CSV-be
+        self._save_to_excel(excel_path)
+        _progress(40)
+
+        # 2. Export CSV-be: közvetlen streamelés a sorlistából
+        # (a None üres cellaként íródik, mint eddig)
         csv_path = f"{base_path}.csv"
         self.app.log_to_display(f"-> Generating CSV: {csv_path}\n")
-        df.to_csv(csv_path, index=False)
+        # A numerikus blokk vektorizáltan formázódik (egy np.char.mod hívás
+        # cellánkénti Python float->str helyett); a NaN üres cella marad
+        temps_block = self._temps[:n].astype(np.float64)
+        cells = np.char.mod('%.8g', temps_block)
+        cells[np.isnan(temps_block)] = ''
+        seconds_list = self._seconds[:n].tolist()
+
+        with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.app.data_columns)
+            # Darabolt írás: korlátos a formázott sorok átmeneti memóriája,
+            # többnapos mérésnél sem egyetlen óriási traversál
+            for i in range(0, n, _CSV_CHUNK_ROWS):
+                hi = min(i + _CSV_CHUNK_ROWS, n)
+                writer.writerows(
+                    [self._types[k], seconds_list[k], self._timestamps[k], *cells[k]]
+                    for k in range(i, hi))
         
-        # 4. Plotok generálása
+        _progress(70)
+
+        # 3. Plotok generálása
         self.app.log_to_display("-> Generating plots (PNG, PDF)...\n")
         self._save_plots(filename_png=f"{base_path}.png", filename_pdf=f"{base_path}.pdf")
-        
+
+        _progress(100)
         self.app.log_to_display("Export process finished.\n")
 
-    def _save_to_excel(self, df: pd.DataFrame, file_path: str):
-        """Save dataframe to Excel and add a chart."""
-        # Workbook és sheets létrehozása
-        writer = pd.ExcelWriter(file_path, engine='xlsxwriter')
-        df.to_excel(writer, sheet_name='Data', index=False)
-        
-        workbook = writer.book
-        worksheet = writer.sheets['Data']
-        
-        # Oszlop szélesség beállítása
-        for i, col in enumerate(df.columns):
-            max_len = max(df[col].astype(str).str.len().max(), len(col)) + 2
-            worksheet.set_column(i, i, max_len)
+    def _save_to_excel(self, file_path: str):
+        """Save the session data to Excel and add a chart.
+
+        Rows are streamed straight from the column buffers into the
+        xlsxwriter worksheet; no intermediate DataFrame copy of the
+        dataset is built. xlsxwriter stays the engine because the chart
+        needs it.
+        """
+        import xlsxwriter
+        from xlsxwriter.utility import xl_col_to_name
+
+        # constant_memory: a kiírt sorok azonnal a temp fájlba kerülnek,
+        # így a memóriaigény a sorszámtól független (O(oszlopok))
+        workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+        worksheet = workbook.add_worksheet('Data')
+
+        # Oszlop szélesség: constant_memory módban a set_column-nak meg
+        # kell előznie a sorok írását. A cellaszélesség ismert felülről
+        # (timestamp 19 karakter, hőmérséklet legfeljebb ~10), nem kell
+        # hozzá minden cellát stringgé alakítani.
+        for i, col in enumerate(self.app.data_columns):
+            cell_width = 19 if col == "Timestamp" else 10
+            worksheet.set_column(i, i, max(len(col), cell_width) + 2)
+
+        worksheet.write_row(0, 0, self.app.data_columns)
+        for row_idx, row in enumerate(self._iter_rows(0, self._n), 1):
+            worksheet.write_row(row_idx, 0, row)
 
         # Grafikon hozzáadása (XY scatter/line chart)
         chart = workbook.add_chart({'type': 'scatter'})
         
         # Add series for each temperature column
-        # df.columns.get_loc("Seconds") a másodperc oszlop
-        seconds_col_num = df.columns.get_loc("Seconds") + 1 # Excel oszlop index (1-től indul)
-        
+        # Az előre felépített _col_index-ből jön az oszlop pozíciója
+        col_index = self._col_index
+        seconds_col_num = col_index["Seconds"] + 1 # Excel oszlop index (1-től indul)
+
         # Hőmérséklet oszlopok: [3:]-tól indulnak az oszlopnevek a self.app.data_columns-ban
-        for i, col in enumerate(self.app.data_columns[3:], 3):  
+        for i, col in enumerate(self._sensor_cols, 3):
             # Ellenőrizzük, hogy az oszlop létezik a DataFrame-ben (a DataProcessor kezeli a lehetséges különbségeket)
-            if col in df.columns:
-                col_num = df.columns.get_loc(col) + 1 # Excel oszlop index
+            if col in col_index:
+                col_num = col_index[col] + 1 # Excel oszlop index
                 
                 # A kategóriák (X tengely) a 'Seconds' oszlop adatai
                 # A 'Data' sheet, a kategóriák 2. sortól (index 1) a másodperc oszlop 2. oszlopától (index 1) indulnak
                 # Categories: ['SheetName', start_row, start_col, end_row, end_col]
                 # Values: ['SheetName', start_row, start_col, end_row, end_col]
                 chart.add_series({
-                    'name': f'=\'Data\'!${chr(65 + col_num - 1)}$1', # pl. ='Data'!$D$1
-                    'categories': ['Data', 1, seconds_col_num - 1, len(df), seconds_col_num - 1],  # Seconds oszlop (pl. C oszlop, 2. sortól)
-                    'values': ['Data', 1, col_num - 1, len(df), col_num - 1], # Az aktuális hőmérséklet oszlop
+                    'name': f'=\'Data\'!${xl_col_to_name(col_num - 1)}$1', # pl. ='Data'!$D$1 (Z fölött is jó)
+                    'categories': ['Data', 1, seconds_col_num - 1, self._n, seconds_col_num - 1],  # Seconds oszlop (pl. C oszlop, 2. sortól)
+                    'values': ['Data', 1, col_num - 1, self._n, col_num - 1], # Az aktuális hőmérséklet oszlop
                 })
         
         chart.set_title({'name': 'Temperature Measurements'})
@@ -222,35 +592,46 @@ class DataProcessor:
 
         # Workbook lezárása
         try:
-            writer.close()
+            workbook.close()
         except Exception as e:
-            self.app.log_to_display(f"Error closing Excel writer: {e}\n")
+            self.app.log_to_display(f"Error closing Excel workbook: {e}\n")
 
 
     def _save_plots(self, filename_png: str = None, filename_pdf: str = None, fmt: str = 'png'):
         """Save plots as PNG and/or PDF."""
-        df = pd.DataFrame(self.data, columns=self.app.data_columns)
-        plt.figure(figsize=(10, 6))
-        
-        for col in self.app.data_columns[3:]:  # Skip Type, Seconds, Timestamp
-            # Az oszlop adatait megpróbáljuk float-ra konvertálni, a None/Inactive értékeket kihagyva
-            df[col] = pd.to_numeric(df[col], errors='coerce') 
-            if col in df.columns:
-                # Azok a sorok, ahol van adat
-                valid_data = df.dropna(subset=[col])
-                if not valid_data.empty:
-                    plt.plot(valid_data['Seconds'], valid_data[col], label=col)
-        
-        plt.xlabel("Seconds")
-        plt.ylabel("Temperature (°C)")
-        plt.title("Temperature Logs")
-        plt.legend()
-        plt.grid(True)
-        
-        # MENTÉS
+        if not self._n:
+            return
+
+        import matplotlib
+        matplotlib.use("Agg")  # headless rendering: no Tk backend round-trips
+        import matplotlib.pyplot as plt
+
+        # A tipizált oszlop-pufferek közvetlenül szeletelhetők - se
+        # DataFrame, se konverzió nem kell a plot úthoz.
+        n = self._n
+        xs = self._seconds[:n]
+        fig, ax = plt.subplots(figsize=(10, 6))
+
+        # A pontkeret a tényleges rajzfelületből jön (szélesség px * 2),
+        # nem fix konstansból - nagyobb/sűrűbb ábra többet kap
+        n_out = int(fig.get_size_inches()[0] * fig.dpi * 2)
+
+        for j, col in enumerate(self._sensor_cols):
+            # A matplotlib a NaN-t szakadásként rajzolja, nem kell dropna
+            ys = self._temps[:n, j]
+            if not np.all(np.isnan(ys)):
+                ax.plot(*_downsample_minmax(xs, ys, n_out), label=col)
+
+        ax.set_xlabel("Seconds")
+        ax.set_ylabel("Temperature (°C)")
+        ax.set_title("Temperature Logs")
+        ax.legend()
+        ax.grid(True)
+
+        # MENTÉS: ugyanabból a felépített Figure-ből megy a PNG és a PDF
         if filename_png:
-            plt.savefig(filename_png, format='png')
+            fig.savefig(filename_png, format='png')
         if filename_pdf:
-            plt.savefig(filename_pdf, format='pdf')
-            
-        plt.close()
+            fig.savefig(filename_pdf, format='pdf')
+
+        plt.close(fig)
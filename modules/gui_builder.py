@@ -4,44 +4,94 @@ GUI builder for Temperature Logger application.
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
+from functools import partial
 from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
 if TYPE_CHECKING:
     from .temp_logger_core import TempLoggerApp
 
+# Ismétlődő grid-opciók egy helyen: a hívóhelyek **-gal terítik szét,
+# így nem épül új dict-literál minden .grid() hívásnál, és a paddingot
+# egy helyen lehet állítani.
+_GRID_STD = {"padx": 5, "pady": 5, "sticky": "W"}
+_GRID_TIGHT = {"padx": 5, "pady": 2, "sticky": "W"}
+
+# A Treeview-ban ténylegesen létező sorok száma: a widget csak egy
+# ennyi soros, újrahasznosított "ablakot" tart a teljes mintasorozatból
+# (virtualizált nézet, lásd bulk_append_rows / _refresh_virtual_rows).
+_VTREE_POOL = 100
+
 class GUIBuilder:
     """Handles GUI initialization and management."""
-    
+
+    _OPERATORS = ('>', '<', '>=', '<=', '=')
+    _LOGICS = ('AND', 'OR')
+
+
     def __init__(self, root: tk.Tk, app: 'TempLoggerApp'):
         self.root = root
         self.app = app
-        self.tooltips = []
-        self.start_conditions_rows: List[Dict[str, Any]] = []
-        self.stop_conditions_rows: List[Dict[str, Any]] = []
+        self._tooltip_pair = None  # közös tooltip ablak (lusta létrehozás)
+        self._screen_size = None   # (szélesség, magasság) cache, lásd _screen_dims
+        # Virtualizált log-nézet: minden minta egy sima Python-listában
+        # marad, a fa csak a pool-nyi látható sort tartja
+        self._log_backing: List[tuple] = []
+        self._vtree_pool: List[str] = []   # újrahasznosított iid-k
+        self._vtree_start = 0              # az ablak első sora a backing-ben
+        self._vtree_follow = True          # a csúszka alul van: kövesse a végét
+        self._sensor_layout = None  # (sid, név, oszlop, sor) cache, lásd _get_sensor_layout
+        # A fül felépítése előtt betöltött konfig-feltételek ide kerülnek,
+        # a _build_conditions_tab játssza vissza őket
+        self._pending_conditions: Dict[str, List[Dict[str, Any]]] = {}
+        self._cond_pending: Dict[str, Any] = {}  # függő after() id-k oldalanként
+        # Sorok a keret id()-jával kulcsolva: a törlés/módosítás O(1)
+        # kikeresés, a dict pedig beszúrási sorrendben iterál, így a
+        # feltétel-kiértékelés sorrendje változatlan
+        self.start_conditions_rows: Dict[int, Dict[str, Any]] = {}
+        self.stop_conditions_rows: Dict[int, Dict[str, Any]] = {}
         self.progress_window: Optional[tk.Toplevel] = None
         self.progress_bar: Optional[ttk.Progressbar] = None
+        self._conditions_built = False
         self.center_window()
         
-        for widget in self.root.winfo_children():
+        # root.children a Tkinter saját, Python-oldali gyerek-dict-je;
+        # a winfo_children() ezzel szemben Tcl-be hívna ki a listáért.
+        for widget in list(self.root.children.values()):
             widget.destroy()
         self.init_gui()
 
+    def _screen_dims(self):
+        """Screen (width, height), queried from Tcl once per session.
+
+        A winfo_screenwidth/height két Tcl körutazás; egy monitoron a
+        futás alatt állandó, ezért minden további középre igazítás a
+        cache-ből dolgozik.
+        """
+        if self._screen_size is None:
+            self._screen_size = (self.root.winfo_screenwidth(),
+                                 self.root.winfo_screenheight())
+        return self._screen_size
+
     def center_window(self):
-        """Center the window on the screen."""
-        self.root.update_idletasks()
+        """Center the window on the screen.
+
+        Nincs update_idletasks(): a méret fix, a képernyőméret pedig nem
+        függ a layouttól, így nincs miért végigfuttatni az idle sort.
+        """
         width, height = 1400, 800
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        screen_w, screen_h = self._screen_dims()
+        x = (screen_w // 2) - (width // 2)
+        y = (screen_h // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
-        
+
     def center_progress_window(self, toplevel: tk.Toplevel):
         """Center the progress window on the screen."""
-        toplevel.update_idletasks()
         width = 300
         height = 80
-        x = (toplevel.winfo_screenwidth() // 2) - (width // 2)
-        y = (toplevel.winfo_screenheight() // 2) - (height // 2)
+        screen_w, screen_h = self._screen_dims()
+        x = (screen_w // 2) - (width // 2)
+        y = (screen_h // 2) - (height // 2)
         toplevel.geometry(f'{width}x{height}+{x}+{y}')
 
     def show_export_progress(self):
@@ -70,8 +120,11 @@ class GUIBuilder:
         self.progress_bar['maximum'] = 100 # Percentage based
 
         # JAVÍTÁS: "wait" kurzor helyett "watch" használata a jobb kompatibilitásért
-        self.root.config(cursor="watch") 
-        self.root.update()
+        self.root.config(cursor="watch")
+        # update_idletasks: csak a függő rajzolást tolja ki; a teljes
+        # update() eseményeket is feldolgozna, ami re-entráns hívásokat
+        # engedne be az export közepén
+        self.root.update_idletasks()
 
     def update_progress(self, value: int):
         """Update the progress bar value (0-100)."""
@@ -87,39 +140,67 @@ class GUIBuilder:
             self.progress_window = None
             self.progress_bar = None
             self.root.config(cursor="") # Visszaállítjuk a normál kurzorra
-            self.root.update()
+            self.root.update_idletasks()
 
     def init_gui(self):
-        """Initialize the GUI elements."""
+        """Initialize the GUI elements.
+
+        A szekciók külön builder metódusok; a feltétel-fül (amit
+        induláskor semmi nem használ) after_idle-lel, az első kirajzolás
+        után épül fel, így rövidebb az első megjelenésig tartó út.
+        """
         self.root.title("Temperature Logger")
         self.root.protocol("WM_DELETE_WINDOW", self.app.on_closing)
-        
+
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
 
+        # Megosztott Style, egyszer konfigurálva: a feltétel-sor építő
+        # csak a stílusnévre hivatkozik, nem példányosít Style-t és nem
+        # konfigurál újra soronként
+        self.style = ttk.Style(self.root)
+        self.style.configure('Danger.TButton', foreground='red')
+
         main_frame = ttk.Frame(self.root, padding="10 10 10 10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_columnconfigure(1, weight=3)
         main_frame.grid_rowconfigure(1, weight=1)
-        
-        # --- Top Control Frame ---
+
+        self._build_control_frame(main_frame)
+        self._build_side_panel(main_frame)
+        self._build_right_panel(main_frame)
+
+        # Status bar for transient (non-modal) toast messages
+        status_bar = ttk.Label(main_frame, textvariable=self.app.status_var, anchor='w')
+        status_bar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E))
+
+        # A feltétel-fül felépítése ráér az első paint után
+        self.root.after_idle(self._build_conditions_tab)
+
+        self.update_start_stop_buttons(False)
+        self.app.data_columns = ["Type", "Seconds", "Timestamp"]
+        self.update_log_treeview_columns([])
+        self.app.log_to_display("Application initialized. Searching for sensors...\n")
+
+    def _build_control_frame(self, main_frame: ttk.Frame):
+        """Top row: measurement name, intervals, output toggle, buttons."""
         control_frame = ttk.Frame(main_frame, padding="5 5 5 5")
         control_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E))
         
         # Measurement Name
-        ttk.Label(control_frame, text="Measurement Name:").grid(row=0, column=0, padx=5, pady=5, sticky='W')
-        ttk.Entry(control_frame, textvariable=self.app.measurement_name, width=30).grid(row=0, column=1, padx=5, pady=5, sticky='W')
+        ttk.Label(control_frame, text="Measurement Name:").grid(row=0, column=0, **_GRID_STD)
+        ttk.Entry(control_frame, textvariable=self.app.measurement_name, width=30).grid(row=0, column=1, **_GRID_STD)
         self.create_tooltip(control_frame.winfo_children()[-1], "File name for the measurement logs.")
 
         # Log Interval (Szélesség 5-re csökkentve)
-        ttk.Label(control_frame, text="Log Interval (s):").grid(row=0, column=2, padx=5, pady=5, sticky='W')
-        ttk.Entry(control_frame, textvariable=self.app.log_interval, width=5).grid(row=0, column=3, padx=5, pady=5, sticky='W')
+        ttk.Label(control_frame, text="Log Interval (s):").grid(row=0, column=2, **_GRID_STD)
+        ttk.Entry(control_frame, textvariable=self.app.log_interval, width=5).grid(row=0, column=3, **_GRID_STD)
         self.create_tooltip(control_frame.winfo_children()[-1], "Interval for writing data to log file (seconds).")
 
         # View Interval (Szélesség 3-ra csökkentve)
-        ttk.Label(control_frame, text="View Interval (s):").grid(row=0, column=4, padx=5, pady=5, sticky='W')
-        ttk.Entry(control_frame, textvariable=self.app.view_interval, width=3).grid(row=0, column=5, padx=5, pady=5, sticky='W')
+        ttk.Label(control_frame, text="View Interval (s):").grid(row=0, column=4, **_GRID_STD)
+        ttk.Entry(control_frame, textvariable=self.app.view_interval, width=3).grid(row=0, column=5, **_GRID_STD)
         self.create_tooltip(control_frame.winfo_children()[-1], "Interval for updating data on the screen (seconds).")
 
         # Output Checkbox és Tooltip (Egyszerűsített felirat)
@@ -129,17 +210,18 @@ class GUIBuilder:
         
         # Start/Stop Buttons
         self.start_button = ttk.Button(control_frame, text="Start Logging", command=self.app.start_logging, state=tk.NORMAL)
-        self.start_button.grid(row=0, column=8, padx=5, pady=5, sticky='W')
-        
+        self.start_button.grid(row=0, column=8, **_GRID_STD)
+
         self.stop_button = ttk.Button(control_frame, text="Stop Logging", command=self.app.stop_logging, state=tk.DISABLED)
-        self.stop_button.grid(row=0, column=9, padx=5, pady=5, sticky='W')
-        
+        self.stop_button.grid(row=0, column=9, **_GRID_STD)
+
         # Open Last Measurement Button (Pozíció a Stop gomb után maradt)
         self.open_folder_button = ttk.Button(control_frame, text="Open Last Measurement", command=self.app.open_last_measurement_folder)
-        self.open_folder_button.grid(row=0, column=10, padx=5, pady=5, sticky='W')
+        self.open_folder_button.grid(row=0, column=10, **_GRID_STD)
         self.create_tooltip(self.open_folder_button, "Opens the folder of the most recently finished measurement session (highest AT:x number).")
 
-
+    def _build_side_panel(self, main_frame: ttk.Frame):
+        """Left panel: settings notebook with the Main tab (sensors, duration)."""
         # --- Side Panel (Container for Notebook) ---
         side_panel = ttk.Frame(main_frame, padding="5 5 5 5")
         side_panel.grid(row=1, column=0, sticky=(tk.N, tk.S, tk.W, tk.E))
@@ -166,18 +248,24 @@ class GUIBuilder:
         
         ttk.Checkbutton(duration_frame, text="Enable Duration Limit", variable=self.app.duration_enabled, command=self._toggle_duration_input).grid(row=0, column=0, columnspan=4, sticky='W')
 
-        ttk.Label(duration_frame, text="Days:").grid(row=1, column=0, padx=5, pady=2, sticky='E')
-        ttk.Entry(duration_frame, textvariable=self.app.duration_days, width=5).grid(row=1, column=1, padx=5, pady=2, sticky='W')
-        
-        ttk.Label(duration_frame, text="Hours:").grid(row=1, column=2, padx=5, pady=2, sticky='E')
-        ttk.Entry(duration_frame, textvariable=self.app.duration_hours, width=5).grid(row=1, column=3, padx=5, pady=2, sticky='W')
-
-        ttk.Label(duration_frame, text="Minutes:").grid(row=1, column=4, padx=5, pady=2, sticky='E')
-        ttk.Entry(duration_frame, textvariable=self.app.duration_minutes, width=5).grid(row=1, column=5, padx=5, pady=2, sticky='W')
+        # Ismétlődő címke+mező párok táblából - a rács-paraméterek egy
+        # helyen vannak, nem hat soron át másolva
+        duration_fields = (("Days:", self.app.duration_days),
+                           ("Hours:", self.app.duration_hours),
+                           ("Minutes:", self.app.duration_minutes))
+        for i, (text, var) in enumerate(duration_fields):
+            ttk.Label(duration_frame, text=text).grid(row=1, column=2 * i, padx=5, pady=2, sticky='E')
+            ttk.Entry(duration_frame, textvariable=var, width=5).grid(row=1, column=2 * i + 1, **_GRID_TIGHT)
         
         self.duration_inputs = duration_frame.winfo_children()[2:]
         self._toggle_duration_input()
 
+    def _build_conditions_tab(self):
+        """Build the Duration/Conditions tab (deferred; idempotent)."""
+        if self._conditions_built:
+            return
+        self._conditions_built = True
+
         # --- TAB 2: Duration/Conditions (Temperature-Controlled) ---
         conditions_tab = ttk.Frame(self.settings_notebook, padding="5")
         self.settings_notebook.add(conditions_tab, text='Duration/Conditions')
@@ -200,14 +288,14 @@ class GUIBuilder:
         header_start.grid(row=0, column=0, sticky='EW')
         header_start.grid_columnconfigure(0, weight=1)
         
-        self.start_enable_check = ttk.Checkbutton(header_start, text="Enable Start Conditions", 
-                                                variable=self.app.temp_start_enabled, 
-                                                command=lambda: self.app.update_conditions_list('start'))
-        self.start_enable_check.grid(row=0, column=0, padx=5, pady=2, sticky='W')
+        self.start_enable_check = ttk.Checkbutton(header_start, text="Enable Start Conditions",
+                                                variable=self.app.temp_start_enabled,
+                                                command=partial(self.app.update_conditions_list, 'start'))
+        self.start_enable_check.grid(row=0, column=0, **_GRID_TIGHT)
         self.create_tooltip(self.start_enable_check, "Enable automatic start based on temperature conditions.")
-        
-        ttk.Button(header_start, text="Add Start Condition", 
-                   command=lambda: self._create_condition_row('start')).grid(row=0, column=1, padx=5, pady=2)
+
+        ttk.Button(header_start, text="Add Start Condition",
+                   command=partial(self._create_condition_row, 'start')).grid(row=0, column=1, padx=5, pady=2)
 
         self.start_conditions_container = ttk.Frame(start_block)
         self.start_conditions_container.grid(row=1, column=0, sticky='NSEW')
@@ -222,19 +310,26 @@ class GUIBuilder:
         header_stop.grid(row=0, column=0, sticky='EW')
         header_stop.grid_columnconfigure(0, weight=1)
 
-        self.stop_enable_check = ttk.Checkbutton(header_stop, text="Enable Stop Conditions", 
+        self.stop_enable_check = ttk.Checkbutton(header_stop, text="Enable Stop Conditions",
                                                 variable=self.app.temp_stop_enabled,
-                                                command=lambda: self.app.update_conditions_list('stop'))
-        self.stop_enable_check.grid(row=0, column=0, padx=5, pady=2, sticky='W')
+                                                command=partial(self.app.update_conditions_list, 'stop'))
+        self.stop_enable_check.grid(row=0, column=0, **_GRID_TIGHT)
         self.create_tooltip(self.stop_enable_check, "Enable automatic stop based on temperature conditions.")
-        
-        ttk.Button(header_stop, text="Add Stop Condition", 
-                   command=lambda: self._create_condition_row('stop')).grid(row=0, column=1, padx=5, pady=2)
+
+        ttk.Button(header_stop, text="Add Stop Condition",
+                   command=partial(self._create_condition_row, 'stop')).grid(row=0, column=1, padx=5, pady=2)
 
         self.stop_conditions_container = ttk.Frame(stop_block)
         self.stop_conditions_container.grid(row=1, column=0, sticky='NSEW')
         self.stop_conditions_container.grid_columnconfigure(0, weight=1)
 
+        # A fül felépítése előtt betöltött konfiguráció visszajátszása
+        for side, conditions in self._pending_conditions.items():
+            self._apply_conditions(conditions, side)
+        self._pending_conditions.clear()
+
+    def _build_right_panel(self, main_frame: ttk.Frame):
+        """Right panel: live log treeview and the application message box."""
         # --- Right Panel: Logs and Plots ---
         right_panel = ttk.Frame(main_frame, padding="5 5 5 5")
         right_panel.grid(row=1, column=1, sticky=(tk.N, tk.S, tk.W, tk.E))
@@ -251,10 +346,18 @@ class GUIBuilder:
         self.app.log_tree = ttk.Treeview(log_view_frame, columns=("Seconds", "Timestamp"), show="headings")
         self.app.log_tree.grid(row=0, column=0, sticky='NSEW')
 
-        # Scrollbars for Treeview
-        log_tree_scrollbar_y = ttk.Scrollbar(log_view_frame, orient="vertical", command=self.app.log_tree.yview)
+        # Scrollbar: nem a fa saját yview-ját hajtja, hanem a virtuális
+        # ablakot tolja a backing lista fölött; az arányait is a
+        # _refresh_virtual_rows állítja, nem a fa
+        log_tree_scrollbar_y = ttk.Scrollbar(log_view_frame, orient="vertical",
+                                             command=self._on_log_scroll)
         log_tree_scrollbar_y.grid(row=0, column=1, sticky='NS')
-        self.app.log_tree.config(yscrollcommand=log_tree_scrollbar_y.set)
+        self._log_scrollbar = log_tree_scrollbar_y
+
+        # Az egérgörgő is a virtuális nézetet mozgassa, ne a pool-t
+        self.app.log_tree.bind('<MouseWheel>', self._on_log_wheel)
+        self.app.log_tree.bind('<Button-4>', self._on_log_wheel)
+        self.app.log_tree.bind('<Button-5>', self._on_log_wheel)
 
         # Log Messages (ScrolledText)
         message_frame = ttk.LabelFrame(right_panel, text="Application Messages", padding="5")
@@ -262,65 +365,361 @@ class GUIBuilder:
         message_frame.grid_rowconfigure(0, weight=1)
         message_frame.grid_columnconfigure(0, weight=1)
 
-        self.app.log_messages = scrolledtext.ScrolledText(message_frame, height=10, state=tk.DISABLED, wrap=tk.WORD)
-        self.app.log_messages.grid(row=0, column=0, sticky='NSEW')
-        
+        # A ScrolledText lusta: az első üzenet-flush hozza létre (lásd
+        # ensure_log_messages), így a legdrágább widget nem az induló
+        # kirajzolási utat terheli.
+        self._message_frame = message_frame
+        self.app.log_messages = None
+
+
         # Styles for Treeview rows
         self.app.log_tree.tag_configure('oddrow', background='#E0E0E0')
         self.app.log_tree.tag_configure('evenrow', background='#F0F0F0')
 
-        self.update_start_stop_buttons(False)
-        self.app.data_columns = ["Type", "Seconds", "Timestamp"] 
-        self.update_log_treeview_columns([])
-        self.app.log_to_display("Application initialized. Searching for sensors...\n")
-
     def _toggle_duration_input(self):
         """Toggle fixed duration input fields."""
         state = tk.NORMAL if self.app.duration_enabled.get() else tk.DISABLED
         for entry in self.duration_inputs:
             entry.config(state=state)
 
-    def _create_condition_row(self, side: str):
-        pass # Placeholder
+    def _get_sensor_layout(self):
+        """Cached (sensor_id, name, column, row) tuples for checkbox grids.
+
+        A sensor_names.items() nézetet és a 3 oszlopos rácspozíciókat
+        feltétel-soronként újraszámolni felesleges: a szenzorkészlet
+        csak init_sensors után változhat, ilyenkor a
+        populate_condition_checkboxes érvényteleníti a cache-t.
+        """
+        if self._sensor_layout is None:
+            self._sensor_layout = tuple(
+                (sid, name, i % 3, i // 3)
+                for i, (sid, name) in
+                enumerate(self.app.sensor_manager.sensor_names.items()))
+        return self._sensor_layout
+
+    def _create_condition_row(self, side: str, cond: Optional[Dict[str, Any]] = None):
+        """Add one condition row (logic + operator + threshold + sensors)."""
+        container = (self.start_conditions_container if side == 'start'
+                     else self.stop_conditions_container)
+        rows = (self.start_conditions_rows if side == 'start'
+                else self.stop_conditions_rows)
+        cond = cond or {}
+
+        row_frame = ttk.Frame(container, padding=2)
+        row_frame.grid(row=len(rows), column=0, sticky='EW', pady=1)
+
+        logic_var = tk.StringVar(self.root, value=cond.get('logic') or 'AND')
+        operator_var = tk.StringVar(self.root, value=cond.get('operator', '>'))
+        threshold_var = tk.StringVar(self.root, value=str(cond.get('threshold', 25.0)))
+        refresh = partial(self.app.update_conditions_list, side)
+
+        # command= a Combobox-on nem sül el kiválasztáskor; a virtuális
+        # <<ComboboxSelected>> esemény az, ami ténylegesen jelez
+        logic_combo = ttk.Combobox(row_frame, textvariable=logic_var,
+                                   values=self._LOGICS, width=4, state='readonly')
+        logic_combo.grid(row=0, column=0, **_GRID_TIGHT)
+        operator_combo = ttk.Combobox(row_frame, textvariable=operator_var,
+                                      values=self._OPERATORS, width=3, state='readonly')
+        operator_combo.grid(row=0, column=1, **_GRID_TIGHT)
+        for combo in (logic_combo, operator_combo):
+            combo._cond_side = side
+            combo.bind('<<ComboboxSelected>>', self._on_condition_widget_change)
+        threshold_entry = ttk.Entry(row_frame, textvariable=threshold_var, width=7)
+        threshold_entry.grid(row=0, column=2, **_GRID_TIGHT)
+        # Közös handler, a kontextus a widgeten (mint a tooltipeknél):
+        # soronként nem keletkezik külön closure
+        threshold_entry._cond_side = side
+        threshold_entry.bind('<FocusOut>', self._on_condition_widget_change)
+
+        row_data: Dict[str, Any] = {'frame': row_frame, 'side': side,
+                                    'selected_sensors': set(cond.get('sensors', ())),
+                                    'logic_var': logic_var,
+                                    'operator_var': operator_var,
+                                    'threshold_var': threshold_var}
+
+        # Szenzoronkénti checkbox-rács helyett egyetlen gomb: a drága
+        # widget-sereg csak akkor épül fel, ha a felhasználó tényleg
+        # megnyitja a választót (lásd _open_sensor_picker)
+        picker_btn = ttk.Button(row_frame,
+                                command=partial(self._open_sensor_picker, row_data))
+        picker_btn.grid(row=0, column=3, **_GRID_TIGHT)
+        row_data['sensor_button'] = picker_btn
+        self._refresh_sensor_button(row_data)
+
+        ttk.Button(row_frame, text='X', width=2, style='Danger.TButton',
+                   command=partial(self._delete_condition_row, row_data, side)
+                   ).grid(row=0, column=4, padx=5, pady=2)
+
+        rows[id(row_frame)] = row_data
+        refresh()
+
+    def _on_condition_widget_change(self, event):
+        """Shared change handler for condition-row widgets.
+
+        A widgetre írt _cond_side attribútumból tudja, melyik oldal
+        feltétel-listáját kell újraépíteni; a tényleges újraépítés
+        debounce-olva fut.
+        """
+        self._schedule_conditions_update(event.widget._cond_side)
+
+    def _schedule_conditions_update(self, side: str):
+        """Coalesce a burst of row edits into one update_conditions_list.
+
+        Egy szerkesztési sorozat (pl. operátor- majd logika-váltás)
+        így egyetlen lista-újraépítést vált ki 50 ms múlva, nem
+        widgetenként egyet.
+        """
+        pending = self._cond_pending.get(side)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._cond_pending[side] = self.root.after(
+            50, self._flush_conditions_update, side)
+
+    def _flush_conditions_update(self, side: str):
+        self._cond_pending[side] = None
+        self.app.update_conditions_list(side)
+
+    def _refresh_sensor_button(self, row_data: Dict[str, Any]):
+        """Show the selection count on the row's sensor-picker button."""
+        count = len(row_data['selected_sensors'])
+        row_data['sensor_button'].config(text=f"Sensors ({count})...")
+
+    def _open_sensor_picker(self, row_data: Dict[str, Any]):
+        """Open the modal sensor picker for one condition row.
+
+        A checkbuttonok és BooleanVar-ok élettartama a dialógusé: sor-
+        beszúráskor nem készül belőlük semmi, és bezáráskor a Toplevel
+        viszi magával őket.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Select Sensors")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        body = ttk.Frame(dialog, padding="10")
+        body.pack(fill='both', expand=True)
+
+        layout = self._get_sensor_layout()
+        selected = row_data['selected_sensors']
+        vars_by_sid = {}
+        for sid, name, col, row in layout:
+            var = tk.BooleanVar(dialog, value=sid in selected)
+            vars_by_sid[sid] = var
+            ttk.Checkbutton(body, text=name, variable=var).grid(row=row, column=col,
+                                                                **_GRID_TIGHT)
+
+        def close():
+            row_data['selected_sensors'] = {sid for sid, var in vars_by_sid.items()
+                                            if var.get()}
+            self._refresh_sensor_button(row_data)
+            self.app.update_conditions_list(row_data['side'])
+            dialog.grab_release()
+            dialog.destroy()
+
+        ok_row = (len(layout) + 2) // 3
+        ttk.Button(body, text="OK", command=close).grid(row=ok_row, column=0,
+                                                        columnspan=3, pady=(8, 0))
+        dialog.protocol("WM_DELETE_WINDOW", close)
 
     def _delete_condition_row(self, row_data: Dict[str, Any], side: str):
-        pass # Placeholder
-
-    def _update_condition_row(self, row_data: Dict[str, Any], side: str):
-        pass # Placeholder
+        """Remove one condition row and compact the remaining grid."""
+        rows = (self.start_conditions_rows if side == 'start'
+                else self.stop_conditions_rows)
+        row_data['frame'].destroy()
+        rows.pop(id(row_data['frame']), None)
+        for i, remaining in enumerate(rows.values()):
+            remaining['frame'].grid_configure(row=i)
+        self.app.update_conditions_list(side)
+
+    def bulk_append_rows(self, rows: List[tuple]):
+        """Append sample rows to the virtualized live log view.
+
+        A minták egy sima Python-listába kerülnek; a Treeview-ban csak a
+        _VTREE_POOL méretű látható ablak létezik, így a widget költsége
+        (C-oldali sorok, geometria) a session hosszától független. Ha a
+        csúszka alul áll, az ablak követi az új mintákat.
+        """
+        backing = self._log_backing
+        backing.extend(rows)
+
+        # A visszagörgethető előzmény is korlátos, ugyanazzal a
+        # max_log_lines plafonnal, mint a minta-pufferek és az üzenet-
+        # doboz; pool-nyi ráhagyással, kötegekben vágunk elölről, hogy a
+        # lista-mozgatás ne tick-enként fusson
+        limit = self.app.max_log_lines
+        if len(backing) > limit + _VTREE_POOL:
+            drop = len(backing) - limit
+            del backing[:drop]
+            self._vtree_start = max(0, self._vtree_start - drop)
+
+        if self._vtree_follow:
+            self._vtree_start = max(0, len(backing) - _VTREE_POOL)
+        self._refresh_virtual_rows()
+
+    def clear_log_view(self):
+        """Reset the virtualized log view for a new session.
+
+        Session-váltáskor a backing lista, az ablak-pozíció és a
+        vég-követés alapállapotba kerül, a pool sorai pedig eltűnnek a
+        fából - az előző session mintái így nem lógnak át az újba
+        (esetleg már más oszlopkiosztás alá vetítve).
+        """
+        self._log_backing = []
+        self._vtree_start = 0
+        self._vtree_follow = True
+        if self._vtree_pool:
+            self.app.log_tree.delete(*self._vtree_pool)
+            self._vtree_pool = []
+        self._log_scrollbar.set(0.0, 1.0)
+
+    def _refresh_virtual_rows(self):
+        """Project the current backing window onto the reusable row pool."""
+        tree = self.app.log_tree
+        backing = self._log_backing
+        start = self._vtree_start
+        window = backing[start:start + _VTREE_POOL]
+
+        # A pool csak nő (legfeljebb _VTREE_POOL-ig), iid-t sosem dobunk el
+        pool = self._vtree_pool
+        insert = tree.insert
+        while len(pool) < len(window):
+            pool.append(insert('', 'end'))
+
+        item = tree.item
+        for iid, values in zip(pool, window):
+            item(iid, values=values)
+
+        # A fa belső nézete a pool aljára áll vég-követésnél (ott vannak
+        # a legfrissebb sorok), egyébként a tetejére
+        tree.yview_moveto(1.0 if self._vtree_follow else 0.0)
+
+        total = len(backing)
+        if total > len(window):
+            self._log_scrollbar.set(start / total, (start + len(window)) / total)
+        else:
+            self._log_scrollbar.set(0.0, 1.0)
+
+    def _on_log_scroll(self, *args):
+        """Scrollbar callback: move the virtual window over the backing list."""
+        total = len(self._log_backing)
+        max_start = max(0, total - _VTREE_POOL)
+        start = self._vtree_start
+        if args[0] == 'moveto':
+            start = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= _VTREE_POOL
+            start += step
+        start = max(0, min(start, max_start))
+        self._vtree_start = start
+        # Alul járva visszakapcsol a vég-követés
+        self._vtree_follow = start >= max_start
+        self._refresh_virtual_rows()
+
+    def _on_log_wheel(self, event):
+        """Mouse wheel over the tree scrolls the virtual window."""
+        if getattr(event, 'num', 0) == 4 or event.delta > 0:
+            self._on_log_scroll('scroll', -3, 'units')
+        else:
+            self._on_log_scroll('scroll', 3, 'units')
+        return 'break'
 
     def update_log_treeview_columns(self, sensor_names: List[str]):
-        pass # Placeholder
+        """Reconfigure the live log treeview columns in one batch.
+
+        displaycolumns is emptied for the duration of the update, so the
+        per-column heading/width calls do not each trigger a relayout -
+        the tree redraws once, when the columns are shown again.
+        """
+        tree = self.app.log_tree
+        columns = ("Seconds", "Timestamp") + tuple(sensor_names)
+        # Előre kiszámolt (szélesség, igazítás, nyújtható) hármasok - a
+        # cikluson belül nincs oszloponkénti elágazás
+        specs = [(90, 'e', False), (150, 'center', False)]
+        specs += [(100, 'e', True)] * (len(columns) - 2)
+
+        tree.configure(displaycolumns=())
+        tree.configure(columns=columns)
+        heading = tree.heading
+        column = tree.column
+        for col, (width, anchor, stretch) in zip(columns, specs):
+            heading(col, text=col)
+            column(col, width=width, anchor=anchor, stretch=stretch)
+        tree.configure(displaycolumns='#all')
         
     def populate_condition_checkboxes(self):
-        pass # Placeholder
-        
-    def create_tooltip(self, widget: tk.Widget, text: str):
-        """Create a simple tooltip for a widget."""
+        """React to a changed sensor set: invalidate the layout cache,
+        prune selections pointing at removed sensors, refresh counts.
+
+        Nincs soronkénti widget-újraépítés: a checkboxok csak a
+        választó dialógusban léteznek, igény szerint.
+        """
+        self._sensor_layout = None
+        valid = set(self.app.sensor_manager.sensor_names)
+        for side, rows in (('start', self.start_conditions_rows),
+                           ('stop', self.stop_conditions_rows)):
+            for row_data in rows.values():
+                row_data['selected_sensors'] &= valid
+                self._refresh_sensor_button(row_data)
+            if rows:
+                self.app.update_conditions_list(side)
+
+    def ensure_log_messages(self) -> "scrolledtext.ScrolledText":
+        """Return the message box widget, creating it on first use.
+
+        A ScrolledText a Text + Scrollbar + keret együttese, az ablak
+        legdrágább widgetje. Az első periodikus flush (ami már a
+        megjelenített ablak alatt fut) hozza létre, nem az init_gui.
+        """
+        if self.app.log_messages is None:
+            # Lusta import: a modul betöltése is csak itt, az első
+            # widget-létrehozáskor fizetődik ki (sys.modules cache-eli)
+            from tkinter import scrolledtext
+            self.app.log_messages = scrolledtext.ScrolledText(
+                self._message_frame, height=10, state=tk.DISABLED, wrap=tk.WORD)
+            self.app.log_messages.grid(row=0, column=0, sticky='NSEW')
+        return self.app.log_messages
         
-        def enter(event):
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            
-            # Position the tooltip relative to the mouse cursor
-            # Use event.x_root and event.y_root for screen coordinates
-            tooltip.wm_geometry(f"+{event.x_root + 20}+{event.y_root + 20}")
-            
-            label = tk.Label(tooltip, text=text, background="yellow", 
-                           relief="solid", borderwidth=1, padx=5, pady=3,
-                           justify=tk.LEFT)
+    def _get_tooltip(self):
+        """Return the shared (Toplevel, Label) tooltip pair, creating it lazily.
+
+        Egyetlen rejtett ablak szolgál ki minden tooltipet: hover-enként
+        csak szöveg-csere + áthelyezés + deiconify történik, nem teljes
+        Toplevel létrehozás és megsemmisítés.
+        """
+        if self._tooltip_pair is None:
+            win = tk.Toplevel(self.root)
+            win.wm_overrideredirect(True)
+            win.withdraw()
+            label = tk.Label(win, background="yellow", relief="solid",
+                             borderwidth=1, padx=5, pady=3, justify=tk.LEFT)
             label.pack()
-            self.tooltips.append(tooltip)
-            widget.tooltip_window = tooltip
-
-        def leave(event):
-            if hasattr(widget, 'tooltip_window') and widget.tooltip_window in self.tooltips:
-                widget.tooltip_window.destroy()
-                self.tooltips.remove(widget.tooltip_window)
-                del widget.tooltip_window
-                
-        widget.bind("<Enter>", enter)
-        widget.bind("<Leave>", leave)
+            self._tooltip_pair = (win, label)
+        return self._tooltip_pair
+
+    def create_tooltip(self, widget: tk.Widget, text: str):
+        """Create a simple tooltip for a widget.
+
+        A szöveg a widgetre kerül attribútumként, a két eseménykezelő
+        pedig közös bound method - widgetenként nem keletkezik külön
+        closure-pár, csak a két bind hívás.
+        """
+        widget._tooltip_text = text
+        widget.bind("<Enter>", self._on_tooltip_enter)
+        widget.bind("<Leave>", self._on_tooltip_leave)
+
+    def _on_tooltip_enter(self, event):
+        win, label = self._get_tooltip()
+        label.config(text=event.widget._tooltip_text)
+        # Position the tooltip relative to the mouse cursor
+        win.wm_geometry(f"+{event.x_root + 20}+{event.y_root + 20}")
+        win.deiconify()
+
+    def _on_tooltip_leave(self, event):
+        if self._tooltip_pair is not None:
+            self._tooltip_pair[0].withdraw()
 
     def update_start_stop_buttons(self, is_running: bool):
         """Update the state of Start/Stop buttons."""
@@ -335,4 +734,22 @@ class GUIBuilder:
             self.open_folder_button.config(state=tk.NORMAL)
 
     def load_conditions_to_rows(self, conditions: List[Dict[str, Any]], side: str):
-        pass # Placeholder
+        """Materialize loaded configuration conditions as GUI rows.
+
+        A feltétel-fül after_idle-lel, az első paint után épül; ha még
+        nincs kész, a feltételek itt várakoznak és a _build_conditions_tab
+        játssza vissza őket.
+        """
+        if not self._conditions_built:
+            self._pending_conditions[side] = list(conditions)
+            return
+        self._apply_conditions(conditions, side)
+
+    def _apply_conditions(self, conditions: List[Dict[str, Any]], side: str):
+        """Replace the side's rows with rows built from condition dicts."""
+        rows = (self.start_conditions_rows if side == 'start'
+                else self.stop_conditions_rows)
+        for row_data in list(rows.values()):
+            self._delete_condition_row(row_data, side)
+        for cond in conditions:
+            self._create_condition_row(side, cond)
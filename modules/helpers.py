@@ -11,35 +11,119 @@ import os
 import time
 from typing import Dict, Any, List, Optional
 from w1thermsensor import SensorNotReadyError
-from functools import wraps
+from functools import lru_cache, wraps
 
+@lru_cache(maxsize=256)
 def sanitize_filename(name: str) -> str:
-    """Sanitize filename."""
+    """Sanitize filename (memoized: the same few names recur every session)."""
     return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
 
 def generate_short_uuid() -> str:
     """Generate short UUID."""
     return str(uuid.uuid4())[:6]
 
+# Persistent counter state: the file is opened and parsed once, then each
+# increment is a seek+truncate+write on the same handle instead of an
+# open/read/parse/close + open/write/close round trip per session.
+_counter_file = None
+_counter_value = 0
+
 def get_next_counter() -> int:
     """Get next counter."""
+    global _counter_file, _counter_value
     try:
-        with open("config/counter.json", "r") as f:
-            data = json.load(f)
-        counter = data.get("session_counter", 0) + 1
-        with open("config/counter.json", "w") as f:
-            json.dump({"session_counter": counter}, f)
-        return counter
+        if _counter_file is None:
+            try:
+                _counter_file = open("config/counter.json", "r+")
+                _counter_value = json.loads(_counter_file.read() or "{}").get("session_counter", 0)
+            except FileNotFoundError:
+                _counter_file = open("config/counter.json", "w+")
+                _counter_value = 0
+        _counter_value += 1
+        _counter_file.seek(0)
+        _counter_file.truncate()
+        json.dump({"session_counter": _counter_value}, _counter_file)
+        _counter_file.flush()
+        return _counter_value
     except Exception:
         return 1
 
+# Expected config keys with their type and default. Used to validate and
+# coerce a loaded config exactly once, so apply sites can index keys
+# directly instead of repeating .get(key, default) with inline defaults.
+_CONFIG_SCHEMA = {
+    "default_name": (str, "Test_Measurement"),
+    "default_log_interval": (int, 10),
+    "default_view_interval": (int, 3),
+    "default_start_threshold": (float, 25.0),
+    "default_stop_threshold": (float, 30.0),
+    "max_log_lines": (int, 1000),
+    "measurement_folder": (str, "measurements"),
+    "config_folder": (str, "config"),
+    "duration_enabled": (bool, False),
+    "fixed_duration_seconds": (int, 0),
+    "temp_start_enabled": (bool, False),
+    "temp_stop_enabled": (bool, False),
+    "start_conditions": (list, []),
+    "stop_conditions": (list, []),
+}
+
+# Tcl-stílusú szöveges boolean-értékek a konfig bool kulcsaihoz
+_BOOL_STRINGS = {
+    "true": True, "yes": True, "on": True, "1": True,
+    "false": False, "no": False, "off": False, "0": False,
+}
+
+def normalize_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Return cfg with every schema key present and typed correctly."""
+    normalized = dict(cfg)
+    for key, (expected_type, default) in _CONFIG_SCHEMA.items():
+        value = normalized.get(key, default)
+        if expected_type is bool:
+            # bool("false") igaz lenne - a szöveges booleant a Tcl-hez
+            # hasonlóan értelmezzük, minden mást a defaultra ejtünk
+            if not isinstance(value, bool):
+                if isinstance(value, str):
+                    value = _BOOL_STRINGS.get(value.strip().lower(), default)
+                elif isinstance(value, (int, float)):
+                    value = bool(value)
+                else:
+                    value = default
+        elif not isinstance(value, expected_type):
+            try:
+                value = expected_type(value)
+            except (TypeError, ValueError):
+                value = default
+        if expected_type is list:
+            value = list(value)  # never share the schema's default list
+        normalized[key] = value
+    return normalized
+
+def normalize_conditions(conditions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Coerce condition thresholds to float once, at load time.
+
+    evaluate_operator runs on every sample tick; parsing the threshold
+    there would repeat the same str->float conversion thousands of times.
+    """
+    normalized = []
+    for cond in conditions:
+        cond = dict(cond)
+        try:
+            cond['threshold'] = float(cond.get('threshold', 0.0))
+        except (TypeError, ValueError):
+            cond['threshold'] = 0.0
+        normalized.append(cond)
+    return normalized
+
 def load_config() -> Dict[str, Any]:
     """Load config."""
     try:
-        with open("config/config.json", "r") as f:
-            return json.load(f)
+        # Binary read + json.loads: the C decoder validates UTF-8 inline,
+        # skipping the TextIOWrapper's separate decode pass.
+        with open("config/config.json", "rb") as f:
+            return normalize_config(json.loads(f.read()))
     except Exception:
-        return get_default_config()
+        return normalize_config(get_default_config())
 
 def get_default_config() -> Dict[str, Any]:
     """Default config."""
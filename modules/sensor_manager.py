@@ -5,13 +5,16 @@ Sensor manager for DS18B20 temperature sensors.
 
 import tkinter as tk
 from tkinter import ttk, simpledialog
+import time
 from w1thermsensor import W1ThermSensor, SensorNotReadyError
-from typing import Dict, List, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .temp_logger_core import TempLoggerApp
 
-from .helpers import sanitize_filename, retry
+from .helpers import sanitize_filename
 
 class SensorManager:
     """Manages DS18B20 sensor initialization, reading, and configuration."""
@@ -19,7 +22,9 @@ class SensorManager:
     def __init__(self, app: 'TempLoggerApp'):
         self.app = app
         self.sensors: List[W1ThermSensor] = []
-        self.sensor_ids: List[str] = []
+        # Tuple: a szenzorkészlet egy session alatt stabil, a hot path-ok
+        # lokális névre kötve iterálják
+        self.sensor_ids: Tuple[str, ...] = ()
         self.sensor_names: Dict[str, str] = {}
         self.sensor_vars: Dict[str, tk.BooleanVar] = {}
         self.sensor_checkbuttons: Dict[str, ttk.Checkbutton] = {}
@@ -27,13 +32,25 @@ class SensorManager:
         self.temp_labels: Dict[str, ttk.Label] = {}
         self.ambient_sensor_id = None
         self.last_readings: Dict[str, Optional[float]] = {} # Tárolja a legutolsó leolvasott adatokat
+        self._pool: Optional[ThreadPoolExecutor] = None # Lazy: párhuzamos szenzor-olvasáshoz
+        self._active_mask: Dict[str, bool] = {} # Checkbox állapotok pillanatképe a mintavételhez
 
     def init_sensors(self):
         """Initialize DS18B20 sensors and update GUI."""
         try:
-            self.sensors = W1ThermSensor.get_available_sensors()
-            self.sensor_ids = [s.id for s in self.sensors]
-            
+            detected = W1ThermSensor.get_available_sensors()
+            detected_ids = tuple(s.id for s in detected)
+
+            # Early skip: if detection returned the same sensor set and the
+            # GUI rows already exist, rebuilding every checkbox and label
+            # (and firing their Tcl traces) would be pure no-op work.
+            if detected_ids and detected_ids == self.sensor_ids and self.sensor_checkbuttons:
+                self.sensors = detected
+                return
+
+            self.sensors = detected
+            self.sensor_ids = detected_ids
+
             # Clear sensor frame if exists (Fontos a hibás megjelenítés javításához)
             if hasattr(self.app, 'sensor_frame') and self.app.sensor_frame:
                 for widget in self.app.sensor_frame.winfo_children():
@@ -53,12 +70,15 @@ class SensorManager:
                 self.sensor_names[sid] = name
                 
                 # Checkbutton for activation (Alapértelmezésben bekapcsolva)
-                var = tk.BooleanVar(value=True) 
+                var = tk.BooleanVar(self.app.root, value=True)
                 self.sensor_vars[sid] = var
-                
+                # A maszk csak UI-változáskor frissül, így a mintavételi út
+                # nem hív Tcl-t szenzoronként
+                var.trace_add('write', self._refresh_active_mask)
+
                 # JAVÍTÁS: Checkbox és label hozzáadása az ismétlődő sorokban
-                chk = ttk.Checkbutton(self.app.sensor_frame, text=name, variable=var, 
-                                      command=lambda s=sid: self.update_sensor_status(s))
+                chk = ttk.Checkbutton(self.app.sensor_frame, text=name, variable=var,
+                                      command=partial(self.update_sensor_status, sid))
                 chk.grid(row=row_num, column=0, padx=5, pady=2, sticky='W')
                 self.sensor_checkbuttons[sid] = chk
 
@@ -69,6 +89,8 @@ class SensorManager:
                 
                 row_num += 1
             
+            self._refresh_active_mask()
+
             if not self.sensors:
                 ttk.Label(self.app.sensor_frame, text="No DS18B20 sensors found.").grid(row=0, column=0, columnspan=2, padx=5, pady=10)
 
@@ -79,6 +101,14 @@ class SensorManager:
         except Exception as e:
             self.app.error_handler("Sensor Init Error", f"Failed to initialize sensors: {str(e)}")
 
+    def _refresh_active_mask(self, *_args):
+        """Snapshot the checkbox states into a plain dict.
+
+        read_sensors may run on a worker thread; reading this dict is a
+        GIL-protected lookup with no Tcl round-trip per sensor.
+        """
+        self._active_mask = {sid: var.get() for sid, var in self.sensor_vars.items()}
+
     def update_sensor_status(self, sensor_id: str):
         """Update sensor status."""
         pass # Placeholder
@@ -87,19 +117,44 @@ class SensorManager:
         """Return the last read temperature data."""
         return self.last_readings
 
-    @retry()
+    def _get_pool(self) -> Optional[ThreadPoolExecutor]:
+        """Lazily create the reader pool once the sensor count is known."""
+        if self._pool is None and self.sensors:
+            self._pool = ThreadPoolExecutor(max_workers=min(len(self.sensors), 8))
+        return self._pool
+
+    def _read_one(self, sensor, max_attempts: int = 3, delay: float = 0.05) -> Optional[float]:
+        """Read one sensor, retrying that sensor only, with exponential backoff."""
+        for attempt in range(max_attempts):
+            try:
+                return sensor.get_temperature()
+            except SensorNotReadyError:
+                if attempt == max_attempts - 1:
+                    return None
+                time.sleep(delay * (1 << attempt))
+        return None
+
     def read_sensors(self) -> Dict[str, Optional[float]]:
-        """Read all active sensors - full readout, no downsampling."""
+        """Read all active sensors concurrently.
+
+        Each DS18B20 conversion blocks ~750 ms in the kernel w1 driver,
+        so serial readout costs N*750 ms. The reads are IO-bound and
+        release the GIL, so a thread pool overlaps the conversions into
+        roughly one conversion time regardless of sensor count. Retries
+        happen per sensor inside _read_one, so one flaky sensor no
+        longer forces the whole readout to be repeated.
+        """
         temps = {sid: None for sid in self.sensor_ids}
-        for sensor in self.sensors:
-            sensor_id = sensor.id
-            if self.sensor_vars.get(sensor_id, tk.BooleanVar(value=False)).get():
-                try:
-                    temps[sensor_id] = sensor.get_temperature()
-                except SensorNotReadyError:
-                    temps[sensor_id] = None
-            # Inactive already None
-        
+        active_mask = self._active_mask
+        active = [s for s in self.sensors if active_mask.get(s.id, False)]
+
+        if active:
+            pool = self._get_pool()
+            futures = {s.id: pool.submit(self._read_one, s) for s in active}
+            for sensor_id, future in futures.items():
+                temps[sensor_id] = future.result()
+        # Inactive already None
+
         # Tároljuk a legutóbbi leolvasást a feltétel ellenőrzéshez
         self.last_readings = temps
         return temps
@@ -5,6 +5,7 @@ Temperature Logger Core Application Class.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import collections
 import threading
 import time
 import os
@@ -20,11 +21,24 @@ if TYPE_CHECKING:
     from .data_processor import DataProcessor
     from .export_manager import ExportManager
 
-from .helpers import load_config, ensure_directories, format_duration
+from .helpers import load_config, ensure_directories, format_duration, normalize_conditions
 
 class TempLoggerApp:
     """Main application class."""
-    
+
+    _DEFAULT_MEASUREMENT_NAME = "Test_Measurement"
+
+    # (config key, Tk variable attribute). load_config() normalizes the
+    # dict against a schema, so every key is present and already typed.
+    _APPLY_TABLE = (
+        ("default_name", "measurement_name"),
+        ("default_log_interval", "log_interval"),
+        ("default_view_interval", "view_interval"),
+        ("duration_enabled", "duration_enabled"),
+        ("temp_start_enabled", "temp_start_enabled"),
+        ("temp_stop_enabled", "temp_stop_enabled"),
+    )
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.config = load_config()
@@ -45,20 +59,36 @@ class TempLoggerApp:
         self.data_columns = []
         self.lock = threading.Lock()
         self.loaded_config = None
+        self._log_line_count = 0  # futó sorszámláló az üzenet-doboz vágásához
+        # Üzenetek gyűjtője: a Tk oldal 100 ms-onként egyszerre üríti,
+        # így üzenetenként nem kell külön after() callback és insert
+        self._log_msg_q: collections.deque = collections.deque(maxlen=2000)
         
-        # Tkinter variables
-        self.measurement_name = tk.StringVar(value="Test_Measurement")
-        self.log_interval = tk.IntVar(value=self.default_log_interval)
-        self.view_interval = tk.IntVar(value=self.default_view_interval)
-        self.generate_output_var = tk.BooleanVar(value=True)
-
-        self.duration_enabled = tk.BooleanVar(value=False)
-        self.duration_days = tk.StringVar(value="0")
-        self.duration_hours = tk.StringVar(value="0")
-        self.duration_minutes = tk.StringVar(value="0")
-        
-        self.temp_start_enabled = tk.BooleanVar(value=False)
-        self.temp_stop_enabled = tk.BooleanVar(value=False)
+        # Tkinter variables - explicit master: a konstruktor így nem
+        # keresi meg minden Var-nál külön a default rootot
+        self.measurement_name = tk.StringVar(root, value=self._DEFAULT_MEASUREMENT_NAME)
+        self.log_interval = tk.IntVar(root, value=self.default_log_interval)
+        self.view_interval = tk.IntVar(root, value=self.default_view_interval)
+        # Az intervallumok int tükrei: a tick-utak ezekből olvasnak,
+        # Tcl hívás nélkül; a trace tartja szinkronban őket
+        self._log_interval_s = max(1, int(self.default_log_interval))
+        self._view_interval_s = max(1, int(self.default_view_interval))
+        self.log_interval.trace_add('write', self._cache_intervals)
+        self.view_interval.trace_add('write', self._cache_intervals)
+        # A stop-feltétel kapcsoló bool tükre: a mintavevő szál ebből
+        # olvas, Tcl hívás nélkül
+        self._temp_stop_enabled_b = False
+        self.generate_output_var = tk.BooleanVar(root, value=True)
+        self.status_var = tk.StringVar(root, value="")
+
+        self.duration_enabled = tk.BooleanVar(root, value=False)
+        self.duration_days = tk.StringVar(root, value="0")
+        self.duration_hours = tk.StringVar(root, value="0")
+        self.duration_minutes = tk.StringVar(root, value="0")
+
+        self.temp_start_enabled = tk.BooleanVar(root, value=False)
+        self.temp_stop_enabled = tk.BooleanVar(root, value=False)
+        self.temp_stop_enabled.trace_add('write', self._cache_stop_flag)
         self.start_conditions: List[Dict[str, Any]] = []
         self.stop_conditions: List[Dict[str, Any]] = []
 
@@ -73,37 +103,27 @@ class TempLoggerApp:
         self.export_manager = ExportManager()
         self.gui = GUIBuilder(root, self)
         
-        self.load_configuration()
+        self.load_configuration(self.config)
         self.sensor_manager.init_sensors()
+        self.root.after(100, self._flush_log_queue)
+        self.root.after(2000, self._flush_log_file)
+        # A frissítő ciklust a Tk eseményhurok ütemezi (root.after),
+        # nem külön Timer szál - az update_loop újraütemezi önmagát
+        self.view_timer = self.root.after(1000, self.update_loop)
 
     def update_loop(self):
-        """Timer for refreshing the GUI with live data."""
+        """Timer for refreshing the GUI with live data.
+
+        A leállítási feltételeket (időtartam, hőmérséklet) a mintavevő
+        szál ellenőrzi közvetlenül a leolvasás után - itt csak a
+        megjelenítés frissül, külön feltétel-kör nélkül.
+        """
         if self.running_event.is_set():
             # Run the live data update function
             self.data_processor.update_live_data()
-            
-            # Check for duration stop condition
-            if self.duration_enabled.get():
-                duration_seconds = self.data_processor.get_total_duration_seconds()
-                if duration_seconds is not None:
-                    elapsed = time.time() - self.measure_start_time
-                    if elapsed >= duration_seconds:
-                        self.log_to_display("STOP CONDITION: Fixed duration reached.\\n")
-                        self.stop_logging()
-                        return # Exit the loop immediately
-            
-            # Check for temperature stop condition
-            if self.temp_stop_enabled.get():
-                if self.data_processor.check_conditions(self.stop_conditions):
-                    self.log_to_display("STOP CONDITION: Temperature condition met.\\n")
-                    self.stop_logging()
-                    return # Exit the loop immediately
 
-
-        # Schedule the next run
-        view_interval = self.view_interval.get()
-        if view_interval < 1: view_interval = 1 # Minimum 1 second for GUI refresh
-        self.view_timer = self.root.after(view_interval * 1000, self.update_loop)
+        # Schedule the next run (a cache-elt int, nincs Tcl lekérdezés)
+        self.view_timer = self.root.after(self._view_interval_s * 1000, self.update_loop)
 
     def start_logging(self):
         """Start the measurement and logging thread."""
@@ -126,7 +146,10 @@ class TempLoggerApp:
     def _wait_for_start(self):
         """Wait loop for temperature start condition."""
         while not self.running_event.is_set():
-            if self.data_processor.check_conditions(self.start_conditions):
+            # Indulás előtt még senki nem olvas, itt kell egy leolvasás;
+            # az eredményt a read_sensors cache-eli is (last_readings)
+            temps = self.sensor_manager.read_sensors()
+            if self.data_processor.check_conditions(self.start_conditions, temps):
                 self.root.after(0, self._start_measurement_thread)
                 return
             
@@ -181,28 +204,32 @@ class TempLoggerApp:
             self.log_thread.join(timeout=5)
             self.log_thread = None
 
-        # Start export in a separate thread to prevent GUI freeze
-        export_thread = threading.Thread(target=self._run_export_process)
+        # Start export in a separate thread to prevent GUI freeze.
+        # A generate_output_var-t még itt, a Tk szálon olvassuk ki - a
+        # worker szál már csak a kész bool-t kapja, Tcl hívás nélkül.
+        export_thread = threading.Thread(target=self._run_export_process,
+                                         args=(self.generate_output_var.get(),))
         export_thread.daemon = True
         export_thread.start()
-        
-    def _run_export_process(self):
+
+    def _run_export_process(self, generate_output: bool):
         """Internal method to manage export thread and GUI updates."""
         try:
             # 1. Show progress bar and change cursor
             self.root.after(0, self.gui.show_export_progress)
-            
+
             # 2. Finalize log file and set end time
             self.data_processor.finalize_session()
-            
+
             # 3. Export data if enabled
-            if self.generate_output_var.get():
+            if generate_output:
                 self.root.after(0, lambda: self.gui.update_progress(10))
-                self.data_processor.export_data(self.root, self.gui.update_progress)
+                self.data_processor.export_data(self.gui.update_progress)
 
             # 4. Hide progress bar and restore cursor
             self.root.after(0, self.gui.hide_export_progress)
             self.log_to_display("Export complete.\\n")
+            self.toast("Export complete")
             
             # 5. Open folder automatically (optional)
             # self.root.after(0, self.open_last_measurement_folder)
@@ -257,49 +284,118 @@ class TempLoggerApp:
         except Exception as e:
             self.error_handler("Folder Error", f"Failed to open last measurement folder: {str(e)}")
             
+    def _cache_intervals(self, *_args):
+        """Mirror the interval Tk variables into plain ints on change."""
+        try:
+            self._log_interval_s = max(1, int(self.log_interval.get()))
+        except tk.TclError:
+            pass  # üres/érvénytelen mező gépelés közben
+        try:
+            self._view_interval_s = max(1, int(self.view_interval.get()))
+        except tk.TclError:
+            pass
+
+    def _cache_stop_flag(self, *_args):
+        """Mirror the stop-condition toggle into a plain bool on change."""
+        try:
+            self._temp_stop_enabled_b = bool(self.temp_stop_enabled.get())
+        except tk.TclError:
+            pass
+
+    def toast(self, message: str, duration_ms: int = 3000):
+        """Show a transient, non-modal message in the status bar.
+
+        Unlike a messagebox this never blocks the main loop waiting for
+        the user to dismiss it; errors keep going through error_handler.
+        """
+        def _show():
+            self.status_var.set(message)
+            # Only clear if no newer toast replaced this one meanwhile.
+            self.root.after(duration_ms,
+                            lambda: self.status_var.get() == message and self.status_var.set(""))
+        self.root.after(0, _show)
+
     def log_to_display(self, message: str):
-        """Log message to the application's message box."""
-        self.root.after(0, lambda: self._update_log_messages(message))
+        """Queue a message for the application's message box.
+
+        Thread-safe: only appends to the deque; the periodic Tk callback
+        flushes all pending messages with a single insert.
+        """
+        self._log_msg_q.append(message)
+
+    def _flush_log_queue(self):
+        """Drain queued messages into the widget in one batch, then re-arm."""
+        q = self._log_msg_q
+        if q:
+            parts = []
+            while q:
+                parts.append(q.popleft())
+            self._update_log_messages("".join(parts))
+        self.root.after(100, self._flush_log_queue)
+
+    def _flush_log_file(self, *, _interval_ms: int = 2000):
+        """Push buffered raw-log rows to the OS every couple of seconds.
+
+        A nyers log blokk-pufferelt; ez a flush korlátozza, mennyi minta
+        veszhet el áramszünetnél, miközben mintánként nem kell syscall.
+        """
+        f = self.log_file
+        if f:
+            try:
+                f.flush()
+            except (OSError, ValueError):
+                pass  # a fájl épp záródik (stop) - a finalize kezeli
+        self.root.after(_interval_ms, self._flush_log_file)
 
     def _update_log_messages(self, message: str):
         """Thread-safe update of the scrolled text widget."""
-        log_widget = self.gui.app.log_messages
+        log_widget = self.gui.ensure_log_messages()
         log_widget.config(state=tk.NORMAL)
         log_widget.insert(tk.END, message)
-        
-        # Limit the number of lines
-        line_count = int(log_widget.index('end-1c').split('.')[0])
-        if line_count > self.max_log_lines:
-            log_widget.delete('1.0', f'{line_count - self.max_log_lines}.0')
-            
+
+        # Limit the number of lines - a futó számláló miatt nem kell
+        # minden beszúrásnál a widgettől lekérdezni a sorok számát
+        self._log_line_count += message.count('\n')
+        if self._log_line_count > self.max_log_lines:
+            drop = self._log_line_count - self.max_log_lines
+            log_widget.delete('1.0', f'{drop + 1}.0')
+            self._log_line_count -= drop
+
         log_widget.see(tk.END)
         log_widget.config(state=tk.DISABLED)
 
-    def load_configuration(self):
-        """Load configuration from JSON and apply settings."""
+    def load_configuration(self, config: Optional[Dict[str, Any]] = None):
+        """Load configuration from JSON and apply settings.
+
+        A caller that already holds a freshly loaded config dict (e.g.
+        __init__) can pass it in to avoid re-reading and re-parsing the
+        JSON file.
+        """
         try:
-            self.loaded_config = load_config()
-            
-            self.measurement_name.set(self.loaded_config.get("default_name", "Test_Measurement"))
-            self.log_interval.set(self.loaded_config.get("default_log_interval", self.default_log_interval))
-            self.view_interval.set(self.loaded_config.get("default_view_interval", self.default_view_interval))
-            
-            self.duration_enabled.set(self.loaded_config.get("duration_enabled", False))
-            
-            duration_s = self.loaded_config.get("fixed_duration_seconds", 0)
+            self.loaded_config = config if config is not None else load_config()
+            cfg = self.loaded_config
+
+            # Data-driven apply: one loop instead of one set() call per field,
+            # and each variable is only touched when its value actually changed.
+            for key, var_attr in self._APPLY_TABLE:
+                var = getattr(self, var_attr)
+                new_value = cfg[key]
+                if var.get() != new_value:
+                    var.set(new_value)
+
+            duration_s = cfg["fixed_duration_seconds"]
             self.duration_days.set(str(duration_s // 86400))
             self.duration_hours.set(str((duration_s % 86400) // 3600))
             self.duration_minutes.set(str((duration_s % 3600) // 60))
-            
-            self.temp_start_enabled.set(self.loaded_config.get("temp_start_enabled", False))
-            self.temp_stop_enabled.set(self.loaded_config.get("temp_stop_enabled", False))
-            
-            self.start_conditions = self.loaded_config.get("start_conditions", [])
-            self.stop_conditions = self.loaded_config.get("stop_conditions", [])
+
+            # Küszöbértékek egyszeri float-tá alakítása: a feltétel-
+            # kiértékelés tick-enként fut, ott már nem kell parse-olni
+            self.start_conditions = normalize_conditions(cfg["start_conditions"])
+            self.stop_conditions = normalize_conditions(cfg["stop_conditions"])
 
             # Legacy threshold conversion (if conditions are empty but thresholds exist)
-            if not self.start_conditions and self.loaded_config.get("start_threshold") is not None:
-                self._convert_legacy_thresholds(self.loaded_config)
+            if not self.start_conditions and cfg.get("start_threshold") is not None:
+                self._convert_legacy_thresholds(cfg)
 
             # GUI condition row creation (must be called after loading)
             try:
@@ -313,6 +409,34 @@ class TempLoggerApp:
         except Exception as e:
             self.error_handler("Error", f"Loading configuration failed: {str(e)}")
 
+    def update_conditions_list(self, side: str):
+        """Rebuild the side's condition dicts from the GUI rows.
+
+        A listát egészben cseréljük, nem helyben módosítjuk: a
+        check_conditions fordító-cache-e lista-identitás alapján
+        érvénytelenít, és a mintavevő szál is csak kész listát láthat.
+        """
+        rows = (self.gui.start_conditions_rows if side == 'start'
+                else self.gui.stop_conditions_rows)
+        sensor_ids = self.sensor_manager.sensor_ids
+        conditions = []
+        for row_data in rows.values():
+            selected = row_data['selected_sensors']
+            # Detektálási sorrendben, hogy a mentett konfig determinisztikus legyen
+            sensors = [sid for sid in sensor_ids if sid in selected]
+            try:
+                threshold = float(row_data['threshold_var'].get())
+            except (TypeError, ValueError):
+                threshold = 0.0
+            conditions.append({'sensors': sensors,
+                               'operator': row_data['operator_var'].get(),
+                               'threshold': threshold,
+                               'logic': row_data['logic_var'].get()})
+        if side == 'start':
+            self.start_conditions = conditions
+        else:
+            self.stop_conditions = conditions
+
     def _convert_legacy_thresholds(self, loaded_config: Dict):
         """Convert old single threshold settings to the new conditions format."""
         all_sensors = self.sensor_manager.sensor_ids
@@ -341,6 +465,9 @@ class TempLoggerApp:
 
     def on_closing(self):
         """Handle application shutdown."""
+        if self.view_timer:
+            self.root.after_cancel(self.view_timer)
+            self.view_timer = None
         self.stop_logging()
         self.root.destroy()
 